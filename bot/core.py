@@ -30,8 +30,8 @@ class DatabaseManager:
         self.connected = True
         logger.info("Database initialized")
     
-    async def check_connection(self) -> bool:
-        """Check database connection"""
+    def check_connection(self) -> bool:
+        """Check database connection (a flag read, so no await needed)"""
         return self.connected
 
 class SecurityManager:
@@ -41,9 +41,9 @@ class SecurityManager:
         self.authenticated = False
         # Get allowed users from environment or use default
         allowed_ids = os.getenv("ALLOWED_USER_IDS", "8286836821")
-        self.allowed_users = [int(x.strip()) for x in allowed_ids.split(",") if x.strip()]
+        self.allowed_users = frozenset(int(x.strip()) for x in allowed_ids.split(",") if x.strip())
     
-    async def authenticate_user(self, user_id: int) -> bool:
+    def authenticate_user(self, user_id: int) -> bool:
         """Authenticate a user"""
         return user_id in self.allowed_users
 
@@ -55,7 +55,7 @@ def require_auth(func: Callable):
             return
         
         user_id = update.effective_user.id
-        if not await self.security.authenticate_user(user_id):
+        if not self.security.authenticate_user(user_id):
             if update.message:
                 await update.message.reply_text(
                     "🚫 You are not authorized to use this command."
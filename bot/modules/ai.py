@@ -1,6 +1,20 @@
 from telegram.ext import Application
 
 class AIManager:
+    MENU = {
+        "text": "🤖 **AI Assistant**\n\nInteract with AI capabilities:",
+        "keyboard": [
+            [
+                {"text": "💬 Ask Question", "callback_data": "ask_ai"},
+                {"text": "🧹 Clear Context", "callback_data": "clear_context"}
+            ],
+            [
+                {"text": "🎤 Voice Mode", "callback_data": "voice_mode"},
+                {"text": "⚙️ AI Settings", "callback_data": "ai_settings"}
+            ]
+        ]
+    }
+    
     def __init__(self, db):
         self.db = db
     
@@ -14,19 +28,7 @@ class AIManager:
         return True
 
     def get_menu(self):
-        return {
-            "text": "🤖 **AI Assistant**\n\nInteract with AI capabilities:",
-            "keyboard": [
-                [
-                    {"text": "💬 Ask Question", "callback_data": "ask_ai"},
-                    {"text": "🧹 Clear Context", "callback_data": "clear_context"}
-                ],
-                [
-                    {"text": "🎤 Voice Mode", "callback_data": "voice_mode"},
-                    {"text": "⚙️ AI Settings", "callback_data": "ai_settings"}
-                ]
-            ]
-        }
+        return self.MENU
 
 class AIConfig:
     """AI Assistant configuration"""
@@ -107,7 +107,7 @@ class AIManager:
             return full_response
             
         except Exception as e:
-            logger.error(f"OpenAI error: {e}")
+            logger.error("OpenAI error: %s", e)
             
             # Fallback to Claude
             try:
@@ -122,7 +122,7 @@ class AIManager:
                 return response.content[0].text
                 
             except Exception as e:
-                logger.error(f"Claude error: {e}")
+                logger.error("Claude error: %s", e)
                 return "Sorry, I'm having trouble accessing AI services right now. Please try again later."
     
     @require_auth
@@ -188,7 +188,7 @@ class AIManager:
             await self._process_query(update.message, text)
             
         except Exception as e:
-            logger.error(f"Voice processing error: {e}")
+            logger.error("Voice processing error: %s", e)
             await update.message.reply_text(
                 "Sorry, I couldn't process your voice message. Please try again."
             )
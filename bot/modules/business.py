@@ -1,6 +1,30 @@
 from telegram.ext import Application
 
 class BusinessManager:
+    MENU = {
+        "text": "⚙️ **Business Operations**\n\nManage your business workflows:",
+        "keyboard": [
+            [
+                {"text": "🏭 n8n Clients", "callback_data": "n8n_clients"},
+                {"text": "🐳 Docker Status", "callback_data": "docker_status"}
+            ],
+            [
+                {"text": "🖥️ VPS Status", "callback_data": "vps_status"},
+                {"text": "📊 System Metrics", "callback_data": "system_metrics"}
+            ]
+        ]
+    }
+
+    ANALYTICS_MENU = {
+        "text": "📈 **Business Analytics**\n\nAnalyze your business performance:",
+        "keyboard": [
+            [
+                {"text": "📊 Performance", "callback_data": "business_performance"},
+                {"text": "📈 Trends", "callback_data": "business_trends"}
+            ]
+        ]
+    }
+    
     def __init__(self, db):
         self.db = db
     
@@ -11,27 +35,7 @@ class BusinessManager:
         pass
 
     def get_menu(self):
-        return {
-            "text": "⚙️ **Business Operations**\n\nManage your business workflows:",
-            "keyboard": [
-                [
-                    {"text": "🏭 n8n Clients", "callback_data": "n8n_clients"},
-                    {"text": "🐳 Docker Status", "callback_data": "docker_status"}
-                ],
-                [
-                    {"text": "🖥️ VPS Status", "callback_data": "vps_status"},
-                    {"text": "📊 System Metrics", "callback_data": "system_metrics"}
-                ]
-            ]
-        }
+        return self.MENU
 
     def get_analytics_menu(self):
-        return {
-            "text": "📈 **Business Analytics**\n\nAnalyze your business performance:",
-            "keyboard": [
-                [
-                    {"text": "📊 Performance", "callback_data": "business_performance"},
-                    {"text": "📈 Trends", "callback_data": "business_trends"}
-                ]
-            ]
-        }
+        return self.ANALYTICS_MENU
@@ -1,6 +1,20 @@
 from telegram.ext import Application
 
 class FinanceManager:
+    MENU = {
+        "text": "💰 **Finance Management**\n\nTrack your financial activities:",
+        "keyboard": [
+            [
+                {"text": "💸 Add Expense", "callback_data": "add_expense"},
+                {"text": "💰 Add Income", "callback_data": "add_income"}
+            ],
+            [
+                {"text": "📊 Balance", "callback_data": "show_balance"},
+                {"text": "📈 Report", "callback_data": "finance_report"}
+            ]
+        ]
+    }
+    
     def __init__(self, db):
         self.db = db
     
@@ -11,16 +25,4 @@ class FinanceManager:
         pass
 
     def get_menu(self):
-        return {
-            "text": "💰 **Finance Management**\n\nTrack your financial activities:",
-            "keyboard": [
-                [
-                    {"text": "💸 Add Expense", "callback_data": "add_expense"},
-                    {"text": "💰 Add Income", "callback_data": "add_income"}
-                ],
-                [
-                    {"text": "📊 Balance", "callback_data": "show_balance"},
-                    {"text": "📈 Report", "callback_data": "finance_report"}
-                ]
-            ]
-        }
+        return self.MENU
@@ -2,6 +2,20 @@ from telegram.ext import Application
 from datetime import datetime
 
 class MonitoringManager:
+    MENU = {
+        "text": "📊 **System Monitoring**\n\nMonitor system health and performance:",
+        "keyboard": [
+            [
+                {"text": "🚨 Active Alerts", "callback_data": "view_alerts"},
+                {"text": "📈 System Metrics", "callback_data": "system_metrics"}
+            ],
+            [
+                {"text": "❤️ Health Check", "callback_data": "health_check"},
+                {"text": "📋 System Logs", "callback_data": "view_logs"}
+            ]
+        ]
+    }
+    
     def __init__(self, db):
         self.db = db
     
@@ -13,17 +27,18 @@ class MonitoringManager:
 
     async def get_recent_logs(self, limit: int = 10):
         # Mock logs for now - replace with real log reading later
+        timestamp = datetime.now().isoformat(sep=" ", timespec="seconds")
         return [
             {
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "timestamp": timestamp,
                 "message": "System operational - All modules running normally"
             },
             {
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"), 
+                "timestamp": timestamp,
                 "message": "Database connection verified"
             },
             {
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "timestamp": timestamp,
                 "message": "Health check completed successfully"
             }
         ]
@@ -32,16 +47,4 @@ class MonitoringManager:
         return True
 
     def get_menu(self):
-        return {
-            "text": "📊 **System Monitoring**\n\nMonitor system health and performance:",
-            "keyboard": [
-                [
-                    {"text": "🚨 Active Alerts", "callback_data": "view_alerts"},
-                    {"text": "📈 System Metrics", "callback_data": "system_metrics"}
-                ],
-                [
-                    {"text": "❤️ Health Check", "callback_data": "health_check"},
-                    {"text": "📋 System Logs", "callback_data": "view_logs"}
-                ]
-            ]
-        }
+        return self.MENU
@@ -26,7 +26,7 @@ class DatabaseManager:
             logger.info("Database connection pool initialized")
             await self.create_tables()
         except Exception as e:
-            logger.error(f"Database initialization failed: {e}")
+            logger.error("Database initialization failed: %s", e)
             raise
     
     async def close(self):
@@ -21,8 +21,8 @@ def setup_logging():
     logging.getLogger('httpx').setLevel(logging.WARNING)
     
     logger = logging.getLogger(__name__)
-    logger.info(f"Personal Bot Assistant v{SystemConfig.VERSION} starting...")
-    logger.info(f"Environment: {SystemConfig.ENVIRONMENT}")
+    logger.info("Personal Bot Assistant v%s starting...", SystemConfig.VERSION)
+    logger.info("Environment: %s", SystemConfig.ENVIRONMENT)
     
     return logger
 
@@ -14,7 +14,7 @@ def require_auth(func):
         
         # Check if user is authorized
         if user_id not in SystemConfig.ALLOWED_USER_IDS:
-            logger.warning(f"Unauthorized access attempt from user {user_id}")
+            logger.warning("Unauthorized access attempt from user %s", user_id)
             await update.message.reply_text(
                 "🚫 Access denied. You are not authorized to use this bot."
             )
@@ -7,27 +7,37 @@ All modules integrated and ready for Railway deployment
 import os
 import sys
 import logging
+import queue
+import threading
 import psutil
 import platform
 import asyncio
-import base64
-import io
-import json
+import random
+import time
+from collections import OrderedDict, defaultdict, deque
+from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, FrozenSet, Optional, Tuple
+from logging.handlers import QueueHandler, QueueListener
 from dotenv import load_dotenv
 
 # Core Telegram imports
 from telegram import (
     Update, 
+    BotCommand,
     InlineKeyboardButton, 
     InlineKeyboardMarkup
 )
+from telegram.error import BadRequest, NetworkError, RetryAfter, TimedOut
 from telegram.ext import (
     Application,
+    ApplicationHandlerStop,
+    BaseRateLimiter,
+    BaseUpdateProcessor,
     CommandHandler,
     CallbackQueryHandler,
     MessageHandler,
+    TypeHandler,
     filters,
     ContextTypes
 )
@@ -82,6 +92,14 @@ except ImportError:
     REQUESTS_AVAILABLE = False
     logging.warning("Requests not available - External APIs limited")
 
+# Faster event loop when installed; the stdlib loop works the same otherwise
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    uvloop = None
+    UVLOOP_AVAILABLE = False
+
 # Load environment variables
 load_dotenv()
 
@@ -95,6 +113,27 @@ logger = logging.getLogger(__name__)
 # Bot Configuration
 BOT_VERSION = "1.2.0"
 BOT_NAME = "UmbraSIL"
+PLATFORM_NAME = platform.system()
+ACTIVE_USER_WINDOW = 24 * 60 * 60  # seconds
+MAX_TRACKED_USERS = 10000
+SYSTEM_METRICS_TTL = 2.0  # seconds
+SSH_TIMEOUT = 5.0  # seconds, per SSH step: TCP connect, banner, auth and the probe command
+# seconds, per Docker/VPS probe on the business menu; outlasts the slowest SSH round-trip
+BUSINESS_PROBE_TIMEOUT = 4 * SSH_TIMEOUT + 2.0
+BUSINESS_OVERVIEW_TTL = 10.0  # seconds
+SSH_KEEPALIVE_INTERVAL = 30  # seconds
+MAX_CONCURRENT_UPDATES = 8
+MAX_API_RETRIES = 8
+ERROR_NOTICE_INTERVAL = 5.0  # seconds between error replies to the same chat
+# Bot API send limits: ~30 requests/s overall and ~1 message/s per chat
+GLOBAL_SEND_RATE = 30.0
+CHAT_SEND_RATE = 1.0
+CHAT_SEND_BURST = 3
+UTC = timezone.utc
+
+def utc_now() -> datetime:
+    """Current time as a timezone-aware UTC datetime"""
+    return datetime.now(UTC)
 
 # Feature flags from environment
 ENABLE_FINANCE = os.getenv("ENABLE_FINANCE", "true").lower() == "true"
@@ -103,14 +142,183 @@ ENABLE_MONITORING = os.getenv("ENABLE_MONITORING", "true").lower() == "true"
 ENABLE_AI = os.getenv("ENABLE_AI", "true").lower() == "true"
 ENABLE_BI = os.getenv("ENABLE_BI", "true").lower() == "true"
 
+MAIN_MENU_TEXT = f"🏠 **Main Menu** - {BOT_NAME} v{BOT_VERSION}\n\nChoose an option:"
+
+# Status icons: CHECK_MARKS is indexed by a bool, unknown health states map to ❌
+CHECK_MARKS = ("❌", "✅")
+HEALTH_STATUS_EMOJI = {"healthy": "✅", "warning": "⚠️"}
+
+# System status screen; version and platform are fixed for the process lifetime
+STATUS_TEMPLATE = f"""
+📊 **System Status**
+
+🤖 **Bot Info**:
+• Version: {BOT_VERSION}
+• Commands: {{command_count}}
+• Success Rate: {{success_rate:.1f}}%
+• Uptime: {{uptime}}
+
+⚙️ **System Resources**:
+• CPU: {{cpu_percent}}%
+• Memory: {{memory_percent}}%
+• Disk: {{disk_percent}}%
+• Platform: {PLATFORM_NAME}
+
+✅ **Status**: All systems operational!
+"""
+
+BOT_INFO_TEMPLATE = f"""
+ℹ️ **Bot Information**
+
+🤖 **UmbraSIL Bot**
+• Version: {BOT_VERSION}
+• Created: 2025
+• Purpose: Personal VPS Assistant
+
+📈 **Current Session**:
+• Started: {{start_time}}
+• Uptime: {{uptime}}
+• Commands Processed: {{command_count}}
+• Avg Response: {{average_response_time:.2f}}s
+• Active Users (24h): {{active_users}}
+
+🔧 **Features**:
+• Secure user authentication
+• System resource monitoring
+• Interactive menu navigation
+• Error handling and logging
+
+✨ **Status**: Running smoothly!
+"""
+
+DOCKER_STATUS_TEMPLATE = """
+🐳 **Docker Status**
+
+📊 **Container Summary**:
+• Total: {total_containers}
+• Running: {running}
+• Stopped: {stopped}
+
+📋 **Recent Containers**:
+{containers}
+"""
+
+MONITORING_MENU_TEMPLATE = """
+📊 **System Monitoring**
+
+{status_emoji} **System Status**: {status}
+
+📈 **Current Metrics**:
+• CPU: {cpu_percent:.1f}%
+• Memory: {memory_percent:.1f}%
+• Disk: {disk_percent:.1f}%
+
+🚨 **Active Alerts**: {alert_count}
+
+Choose an action:
+"""
+
+# Static callback replies
+AI_ASK_TEXT = "🤖 **AI Assistant**\n\nType your question in the chat or use format:\n`ai: your question here`\n\nExample: `ai: What's the best way to manage my finances?`"
+EXPENSE_HELP_TEXT = "💸 **Add Expense**\n\nTo add an expense, use the format:\n`expense: amount category description`\n\nExample: `expense: 25.50 food Pizza for lunch`"
+INCOME_HELP_TEXT = "💰 **Add Income**\n\nTo add income, use the format:\n`income: amount source description`\n\nExample: `income: 2500 salary Monthly salary`"
+BUSINESS_SERVICES_TEXT = "🔧 **Business Services**\n\nService management features:\n• n8n workflow automation\n• Docker container management\n• VPS monitoring\n• System metrics\n\nUse the business menu to access specific services."
+MONITORING_LOGS_TEXT = "📋 **System Logs**\n\nRecent bot activity:\n• Bot started successfully\n• All modules initialized\n• System monitoring active\n\nFor detailed logs, check your hosting platform's log viewer."
+
+# Static keyboards - built once and reused for every reply
+BACK_TO_MAIN_MARKUP = InlineKeyboardMarkup([[InlineKeyboardButton("🏠 Main Menu", callback_data="main_menu")]])
+BACK_TO_MENU_MARKUP = InlineKeyboardMarkup([[InlineKeyboardButton("🏠 Menu", callback_data="main_menu")]])
+BACK_TO_AI_MARKUP = InlineKeyboardMarkup([[InlineKeyboardButton("🤖 AI Menu", callback_data="ai_menu")]])
+BACK_TO_FINANCE_MARKUP = InlineKeyboardMarkup([[InlineKeyboardButton("💰 Finance Menu", callback_data="finance_menu")]])
+BACK_TO_BUSINESS_MARKUP = InlineKeyboardMarkup([[InlineKeyboardButton("⚙️ Business Menu", callback_data="business_menu")]])
+BACK_TO_MONITORING_MARKUP = InlineKeyboardMarkup([[InlineKeyboardButton("📊 Monitoring Menu", callback_data="monitoring_menu")]])
+
+HELP_MARKUP = InlineKeyboardMarkup([
+    [
+        InlineKeyboardButton("🏠 Main Menu", callback_data="main_menu"),
+        InlineKeyboardButton("📊 Status", callback_data="system_status")
+    ]
+])
+
+STATUS_MARKUP = InlineKeyboardMarkup([
+    [
+        InlineKeyboardButton("🔄 Refresh", callback_data="system_status"),
+        InlineKeyboardButton("🏠 Menu", callback_data="main_menu")
+    ]
+])
+
+BOT_INFO_MARKUP = InlineKeyboardMarkup([
+    [
+        InlineKeyboardButton("📊 System Status", callback_data="system_status"),
+        InlineKeyboardButton("🏠 Menu", callback_data="main_menu")
+    ]
+])
+
+AI_MENU_MARKUP = InlineKeyboardMarkup([
+    [
+        InlineKeyboardButton("💬 Ask Question", callback_data="ai_ask"),
+        InlineKeyboardButton("🧹 Clear Context", callback_data="ai_clear")
+    ],
+    [
+        InlineKeyboardButton("🏠 Main Menu", callback_data="main_menu")
+    ]
+])
+
+FINANCE_MENU_MARKUP = InlineKeyboardMarkup([
+    [
+        InlineKeyboardButton("💸 Add Expense", callback_data="finance_expense"),
+        InlineKeyboardButton("💰 Add Income", callback_data="finance_income")
+    ],
+    [
+        InlineKeyboardButton("📊 View Balance", callback_data="finance_balance"),
+        InlineKeyboardButton("📈 Generate Report", callback_data="finance_report")
+    ],
+    [
+        InlineKeyboardButton("🏠 Main Menu", callback_data="main_menu")
+    ]
+])
+
+BUSINESS_MENU_MARKUP = InlineKeyboardMarkup([
+    [
+        InlineKeyboardButton("🐳 Docker Status", callback_data="business_docker"),
+        InlineKeyboardButton("🖥️ VPS Status", callback_data="business_vps")
+    ],
+    [
+        InlineKeyboardButton("📊 System Metrics", callback_data="business_metrics"),
+        InlineKeyboardButton("🔧 Services", callback_data="business_services")
+    ],
+    [
+        InlineKeyboardButton("🏠 Main Menu", callback_data="main_menu")
+    ]
+])
+
+MONITORING_MENU_MARKUP = InlineKeyboardMarkup([
+    [
+        InlineKeyboardButton("📈 System Metrics", callback_data="monitoring_metrics"),
+        InlineKeyboardButton("🚨 View Alerts", callback_data="monitoring_alerts")
+    ],
+    [
+        InlineKeyboardButton("❤️ Health Check", callback_data="monitoring_health"),
+        InlineKeyboardButton("📋 System Logs", callback_data="monitoring_logs")
+    ],
+    [
+        InlineKeyboardButton("🏠 Main Menu", callback_data="main_menu")
+    ]
+])
+
 class BotMetrics:
     """Track bot performance metrics"""
     
     def __init__(self):
-        self.start_time = datetime.now(timezone.utc)
+        self.start_time = utc_now()
+        self.start_time_text = self.start_time.strftime('%H:%M:%S UTC')
+        self._start_monotonic = time.monotonic()
         self.command_count = 0
         self.error_count = 0
-        self.active_users: Dict[int, datetime] = {}
+        self._snapshot = None
+        self.response_times = deque(maxlen=1000)
+        self._response_time_sum = 0.0
+        self.active_users: OrderedDict[int, float] = OrderedDict()  # user_id -> monotonic last seen, least recent first
         self.module_stats = {
             "finance": {"commands": 0, "errors": 0},
             "business": {"commands": 0, "errors": 0},
@@ -120,34 +328,95 @@ class BotMetrics:
     
     def log_command(self, response_time: float, module: str = "core"):
         self.command_count += 1
+        self._snapshot = None
+        if len(self.response_times) == self.response_times.maxlen:
+            self._response_time_sum -= self.response_times[0]
+        self.response_times.append(response_time)
+        self._response_time_sum += response_time
         if module in self.module_stats:
             self.module_stats[module]["commands"] += 1
     
     def log_error(self, error: str, module: str = "core"):
         self.error_count += 1
+        self._snapshot = None
         if module in self.module_stats:
             self.module_stats[module]["errors"] += 1
-        logger.error(f"Bot error in {module}: {error}")
+        logger.error("Bot error in %s: %s", module, error)
     
     def log_user_activity(self, user_id: int):
-        self.active_users[user_id] = datetime.now(timezone.utc)
+        now = time.monotonic()
+        self.active_users[user_id] = now
+        self.active_users.move_to_end(user_id)
+        if len(self.active_users) > MAX_TRACKED_USERS:
+            self.active_users.popitem(last=False)
+        self._expire_active_users(now)
+    
+    def _expire_active_users(self, now: float):
+        """Drop users not seen within ACTIVE_USER_WINDOW"""
+        cutoff = now - ACTIVE_USER_WINDOW
+        while self.active_users and next(iter(self.active_users.values())) < cutoff:
+            self.active_users.popitem(last=False)
+    
+    def get_active_users_count(self) -> int:
+        self._expire_active_users(time.monotonic())
+        return len(self.active_users)
+    
+    def get_uptime_seconds(self) -> int:
+        return int(time.monotonic() - self._start_monotonic)
     
     def get_uptime(self) -> timedelta:
-        return datetime.now(timezone.utc) - self.start_time
+        """Uptime in whole seconds, immune to wall-clock adjustments"""
+        return timedelta(seconds=self.get_uptime_seconds())
+    
+    def get_average_response_time(self) -> float:
+        if not self.response_times:
+            return 0.0
+        return self._response_time_sum / len(self.response_times)
     
     def get_success_rate(self) -> float:
         if self.command_count == 0:
             return 100.0
         return ((self.command_count - self.error_count) / self.command_count) * 100
+    
+    def get_snapshot(self) -> Dict[str, Any]:
+        """Command counters for status screens, rebuilt only after they change"""
+        if self._snapshot is None:
+            self._snapshot = {
+                "command_count": self.command_count,
+                "error_count": self.error_count,
+                "success_rate": self.get_success_rate(),
+                "average_response_time": self.get_average_response_time()
+            }
+        return self._snapshot
+
+@dataclass(frozen=True, slots=True)
+class BotConfig:
+    """Startup configuration, read from the environment once"""
+    token: str
+    allowed_users: FrozenSet[int]
+
+def parse_user_ids(raw: str) -> FrozenSet[int]:
+    """Parse a comma-separated list of Telegram user IDs"""
+    return frozenset(int(x.strip()) for x in raw.split(",") if x.strip())
+
+def load_config() -> BotConfig:
+    """Read bot configuration from the environment"""
+    token = os.getenv("TELEGRAM_BOT_TOKEN")
+    if not token:
+        raise ValueError("TELEGRAM_BOT_TOKEN environment variable not set")
+    
+    return BotConfig(
+        token=token,
+        allowed_users=parse_user_ids(os.getenv("ALLOWED_USER_IDS", "8286836821"))
+    )
 
 class SimpleAuth:
     """Simple authentication system"""
     
-    def __init__(self):
-        allowed_ids = os.getenv("ALLOWED_USER_IDS", "8286836821")
-        self.allowed_users = [int(x.strip()) for x in allowed_ids.split(",") if x.strip()]
+    def __init__(self, allowed_users: FrozenSet[int]):
+        self.allowed_users = allowed_users
     
-    async def authenticate_user(self, user_id: int) -> bool:
+    def authenticate_user(self, user_id: int) -> bool:
         return user_id in self.allowed_users
 
 class AIManager:
@@ -194,7 +463,7 @@ class AIManager:
                 return response.content[0].text
             
         except Exception as e:
-            logger.error(f"AI response error: {e}")
+            logger.error("AI response error: %s", e)
             return f"🤖 AI service temporarily unavailable: {str(e)[:100]}"
         
         return "🤖 No AI providers configured."
@@ -218,14 +487,14 @@ class FinanceManager:
                 "amount": amount,
                 "category": category,
                 "description": description,
-                "timestamp": datetime.now(timezone.utc),
+                "timestamp": utc_now(),
                 "currency": self.currency
             }
             self.transactions.append(transaction)
             self.balance -= amount
             return True
         except Exception as e:
-            logger.error(f"Add expense error: {e}")
+            logger.error("Add expense error: %s", e)
             return False
     
     async def add_income(self, amount: float, source: str, description: str = "") -> bool:
@@ -236,19 +505,19 @@ class FinanceManager:
                 "amount": amount,
                 "source": source,
                 "description": description,
-                "timestamp": datetime.now(timezone.utc),
+                "timestamp": utc_now(),
                 "currency": self.currency
             }
             self.transactions.append(transaction)
             self.balance += amount
             return True
         except Exception as e:
-            logger.error(f"Add income error: {e}")
+            logger.error("Add income error: %s", e)
             return False
     
     async def get_balance(self) -> Dict[str, Any]:
         """Get current balance and summary"""
-        today = datetime.now(timezone.utc).date()
+        today = utc_now().date()
         today_transactions = [t for t in self.transactions if t["timestamp"].date() == today]
         
         today_income = sum(t["amount"] for t in today_transactions if t["type"] == "income")
@@ -271,7 +540,7 @@ class BusinessManager:
             try:
                 self.docker_client = docker.from_env()
             except Exception as e:
-                logger.error(f"Docker client initialization error: {e}")
+                logger.error("Docker client initialization error: %s", e)
         
         self.vps_config = {
             "host": os.getenv("VPS_HOST"),
@@ -279,12 +548,49 @@ class BusinessManager:
             "username": os.getenv("VPS_USERNAME"),
             "password": os.getenv("VPS_PASSWORD")
         }
+        self._overview_cache: Optional[Tuple[Dict[str, Any], Dict[str, Any]]] = None
+        self._overview_cache_time = 0.0
+        self._overview_lock = asyncio.Lock()
+        # Persistent SSH session, shared by the worker threads that run VPS probes
+        self._ssh = None
+        self._ssh_lock = threading.Lock()
     
     def is_operational(self) -> bool:
         return ENABLE_BUSINESS
     
     async def get_docker_status(self) -> Dict[str, Any]:
         """Get Docker container status"""
+        return await asyncio.to_thread(self._probe_docker)
+    
+    async def get_vps_status(self) -> Dict[str, Any]:
+        """Get VPS status via SSH"""
+        return await asyncio.to_thread(self._probe_vps)
+    
+    async def get_overview(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Docker and VPS status for the business menu, probed at most once per BUSINESS_OVERVIEW_TTL"""
+        async with self._overview_lock:
+            now = time.monotonic()
+            if self._overview_cache is None or now - self._overview_cache_time > BUSINESS_OVERVIEW_TTL:
+                self._overview_cache = await self._probe_overview()
+                self._overview_cache_time = time.monotonic()
+            return self._overview_cache
+    
+    async def _probe_overview(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Probe Docker and the VPS concurrently, each bounded by BUSINESS_PROBE_TIMEOUT"""
+        results = await asyncio.gather(
+            asyncio.wait_for(self.get_docker_status(), BUSINESS_PROBE_TIMEOUT),
+            asyncio.wait_for(self.get_vps_status(), BUSINESS_PROBE_TIMEOUT),
+            return_exceptions=True
+        )
+        docker_status, vps_status = (
+            {"error": "Timed out" if isinstance(result, asyncio.TimeoutError) else str(result)}
+            if isinstance(result, Exception) else result
+            for result in results
+        )
+        return docker_status, vps_status
+    
+    def _probe_docker(self) -> Dict[str, Any]:
+        """Blocking Docker API call; run off the event loop"""
         if not self.docker_client:
             return {"error": "Docker not available"}
         
@@ -299,29 +605,60 @@ class BusinessManager:
         except Exception as e:
             return {"error": str(e)}
     
-    async def get_vps_status(self) -> Dict[str, Any]:
-        """Get VPS status via SSH"""
+    def _probe_vps(self) -> Dict[str, Any]:
+        """Blocking SSH round-trip; run off the event loop"""
         if not PARAMIKO_AVAILABLE or not self.vps_config["host"]:
             return {"error": "VPS connection not configured"}
         
-        try:
+        # Hold the lock for the whole round-trip so close() cannot pull the session away mid-probe
+        with self._ssh_lock:
+            try:
+                ssh = self._get_ssh()
+                stdin, stdout, stderr = ssh.exec_command("uptime && df -h / && free -m", timeout=SSH_TIMEOUT)
+                result = stdout.read().decode()
+                
+                return {"status": "connected", "info": result[:500]}
+            except Exception as e:
+                # Reconnect from scratch on the next probe
+                self._close_ssh()
+                return {"error": str(e)}
+    
+    def _get_ssh(self) -> "paramiko.SSHClient":
+        """Return the open SSH session, reconnecting if the transport has dropped (hold _ssh_lock)"""
+        transport = self._ssh.get_transport() if self._ssh else None
+        if transport is None or not transport.is_active():
+            self._close_ssh()
             ssh = paramiko.SSHClient()
-            ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            ssh.connect(
-                hostname=self.vps_config["host"],
-                port=self.vps_config["port"],
-                username=self.vps_config["username"],
-                password=self.vps_config["password"],
-                timeout=10
-            )
-            
-            stdin, stdout, stderr = ssh.exec_command("uptime && df -h / && free -m")
-            result = stdout.read().decode()
-            ssh.close()
-            
-            return {"status": "connected", "info": result[:500]}
-        except Exception as e:
-            return {"error": str(e)}
+            try:
+                ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+                ssh.connect(
+                    hostname=self.vps_config["host"],
+                    port=self.vps_config["port"],
+                    username=self.vps_config["username"],
+                    password=self.vps_config["password"],
+                    timeout=SSH_TIMEOUT,
+                    banner_timeout=SSH_TIMEOUT,
+                    auth_timeout=SSH_TIMEOUT
+                )
+                # Keep NAT/firewall state alive so idle sessions are not silently dropped
+                ssh.get_transport().set_keepalive(SSH_KEEPALIVE_INTERVAL)
+            except Exception:
+                # Don't leak the half-open client and its transport
+                ssh.close()
+                raise
+            self._ssh = ssh
+        return self._ssh
+    
+    def _close_ssh(self):
+        """Close the cached SSH session (hold _ssh_lock)"""
+        if self._ssh:
+            self._ssh.close()
+            self._ssh = None
+    
+    def close(self):
+        """Close the persistent SSH session, waiting for any probe still using it"""
+        with self._ssh_lock:
+            self._close_ssh()
 
 class MonitoringManager:
     """System Monitoring Manager"""
@@ -333,48 +670,199 @@ class MonitoringManager:
             "memory": int(os.getenv("MEMORY_THRESHOLD", "80")),
             "disk": int(os.getenv("DISK_THRESHOLD", "85"))
         }
+        self.thresholds_text = (
+            "🔔 **Alert Thresholds**:\n"
+            f"• CPU: {self.thresholds['cpu']}%\n"
+            f"• Memory: {self.thresholds['memory']}%\n"
+            f"• Disk: {self.thresholds['disk']}%"
+        )
+        self._metrics_cache: Dict[str, float] = {}
+        self._metrics_cache_time = 0.0
+        self._metrics_lock = asyncio.Lock()
+        # Prime psutil's CPU baseline so later samples need no sampling sleep
+        psutil.cpu_percent(interval=None)
     
     def is_operational(self) -> bool:
         return ENABLE_MONITORING
     
+    @staticmethod
+    def _sample_memory_and_disk() -> Dict[str, float]:
+        """psutil sampling (disk_usage can block on slow mounts) - run off the event loop"""
+        return {
+            "memory_percent": psutil.virtual_memory().percent,
+            "disk_percent": psutil.disk_usage('/').percent
+        }
+    
+    async def get_system_metrics(self) -> Dict[str, float]:
+        """CPU/memory/disk usage, sampled at most once per SYSTEM_METRICS_TTL"""
+        async with self._metrics_lock:
+            now = time.monotonic()
+            if now - self._metrics_cache_time > SYSTEM_METRICS_TTL:
+                # CPU usage since the previous sample. psutil keeps that baseline per thread,
+                # so this stays on the event loop thread that __init__ primed; it doesn't block.
+                cpu_percent = psutil.cpu_percent(interval=None)
+                self._metrics_cache = {
+                    "cpu_percent": cpu_percent,
+                    **await asyncio.to_thread(self._sample_memory_and_disk)
+                }
+                self._metrics_cache_time = time.monotonic()
+            return self._metrics_cache
+    
     async def check_system_health(self) -> Dict[str, Any]:
         """Comprehensive system health check"""
         try:
             # Get system metrics
-            cpu_percent = psutil.cpu_percent(interval=1)
-            memory = psutil.virtual_memory()
-            disk = psutil.disk_usage('/')
+            metrics = await self.get_system_metrics()
+            cpu_percent = metrics["cpu_percent"]
+            memory_percent = metrics["memory_percent"]
+            disk_percent = metrics["disk_percent"]
             
             # Check thresholds
             alerts = []
             if cpu_percent > self.thresholds["cpu"]:
                 alerts.append(f"High CPU usage: {cpu_percent}%")
-            if memory.percent > self.thresholds["memory"]:
-                alerts.append(f"High memory usage: {memory.percent}%")
-            if disk.percent > self.thresholds["disk"]:
-                alerts.append(f"High disk usage: {disk.percent}%")
+            if memory_percent > self.thresholds["memory"]:
+                alerts.append(f"High memory usage: {memory_percent}%")
+            if disk_percent > self.thresholds["disk"]:
+                alerts.append(f"High disk usage: {disk_percent}%")
             
             return {
                 "cpu_percent": cpu_percent,
-                "memory_percent": memory.percent,
-                "disk_percent": disk.percent,
+                "memory_percent": memory_percent,
+                "disk_percent": disk_percent,
                 "alerts": alerts,
                 "status": "healthy" if not alerts else "warning"
             }
         except Exception as e:
             return {"error": str(e), "status": "error"}
 
+class ChatOrderedUpdateProcessor(BaseUpdateProcessor):
+    """Process updates from different chats concurrently, in arrival order within a chat"""
+    
+    def __init__(self, max_concurrent_updates: int):
+        # The base class takes its semaphore before do_process_update, so updates queued
+        # behind a slow one in the same chat would hold every slot and stall other chats.
+        # Leave that semaphore unbounded and apply the limit after the chat's lock instead.
+        super().__init__(sys.maxsize)
+        self._slots = asyncio.Semaphore(max_concurrent_updates)
+        self._chat_locks: Dict[int, asyncio.Lock] = {}
+        self._chat_pending: Dict[int, int] = defaultdict(int)
+    
+    async def do_process_update(self, update: object, coroutine) -> None:
+        chat = update.effective_chat if isinstance(update, Update) else None
+        if chat is None:
+            async with self._slots:
+                await coroutine
+            return
+        
+        chat_id = chat.id
+        lock = self._chat_locks.get(chat_id)
+        if lock is None:
+            lock = self._chat_locks[chat_id] = asyncio.Lock()
+        self._chat_pending[chat_id] += 1
+        try:
+            async with lock:
+                async with self._slots:
+                    await coroutine
+        finally:
+            # Forget idle chats so the lock table stays bounded
+            self._chat_pending[chat_id] -= 1
+            if not self._chat_pending[chat_id]:
+                del self._chat_pending[chat_id]
+                del self._chat_locks[chat_id]
+    
+    async def initialize(self) -> None:
+        pass
+    
+    async def shutdown(self) -> None:
+        pass
+
+class TokenBucket:
+    """Token bucket that hands out send slots instead of rejecting callers"""
+    
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+    
+    def reserve(self) -> float:
+        """Take one token and return how many seconds to wait before using it"""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+class RetryingRateLimiter(BaseRateLimiter):
+    """Throttle Bot API calls to Telegram's limits and retry flood control / network errors"""
+    
+    def __init__(self, max_retries: int = MAX_API_RETRIES):
+        self.max_retries = max_retries
+        self._global_bucket = TokenBucket(GLOBAL_SEND_RATE, GLOBAL_SEND_RATE)
+        self._chat_buckets: OrderedDict[Any, TokenBucket] = OrderedDict()  # least recently used first
+    
+    def _reserve(self, chat_id) -> float:
+        """Seconds to wait before the next request (to chat_id, if any) may go out"""
+        delay = self._global_bucket.reserve()
+        if chat_id is None:
+            return delay
+        
+        bucket = self._chat_buckets.get(chat_id)
+        if bucket is None:
+            bucket = self._chat_buckets[chat_id] = TokenBucket(CHAT_SEND_RATE, CHAT_SEND_BURST)
+            if len(self._chat_buckets) > MAX_TRACKED_USERS:
+                self._chat_buckets.popitem(last=False)
+        else:
+            self._chat_buckets.move_to_end(chat_id)
+        return max(delay, bucket.reserve())
+    
+    async def initialize(self) -> None:
+        pass
+    
+    async def shutdown(self) -> None:
+        pass
+    
+    async def process_request(self, callback, args, kwargs, endpoint, data, rate_limit_args):
+        delay = self._reserve(data.get("chat_id"))
+        if delay:
+            await asyncio.sleep(delay)
+        
+        for attempt in range(self.max_retries + 1):
+            try:
+                return await callback(*args, **kwargs)
+            except RetryAfter as e:
+                if attempt == self.max_retries:
+                    raise
+                retry_after = e.retry_after
+                if isinstance(retry_after, timedelta):
+                    retry_after = retry_after.total_seconds()
+                delay = retry_after + random.uniform(0, 0.25)
+            except TimedOut:
+                # The request may already have been delivered; retrying could duplicate it
+                raise
+            except BadRequest:
+                # A 400 fails the same way every time (BadRequest subclasses NetworkError)
+                raise
+            except NetworkError:
+                if attempt == self.max_retries:
+                    raise
+                delay = min(2 ** attempt, 30) + random.random()
+            
+            logger.warning("Telegram %s failed, retrying in %.1fs (%s/%s)", endpoint, delay, attempt + 1, self.max_retries)
+            await asyncio.sleep(delay)
+
 class UmbraSILBot:
     """Main bot class - fully featured with all modules integrated"""
     
-    def __init__(self):
-        self.token = os.getenv("TELEGRAM_BOT_TOKEN")
-        if not self.token:
-            raise ValueError("TELEGRAM_BOT_TOKEN environment variable not set")
+    def __init__(self, config: Optional[BotConfig] = None):
+        config = config or load_config()
+        self.token = config.token
         
         # Initialize core components
         self.metrics = BotMetrics()
-        self.auth = SimpleAuth()
+        self.auth = SimpleAuth(config.allowed_users)
+        self._error_notices: OrderedDict[int, float] = OrderedDict()  # chat_id -> last notice time
         
         # Initialize NLP Manager for natural language understanding
         self.nlp_manager = None
@@ -391,96 +879,67 @@ class UmbraSILBot:
         self.business_manager = BusinessManager()
         self.monitoring_manager = MonitoringManager()
         
-        # Create application
-        self.application = Application.builder().token(self.token).build()
-        self.setup_handlers()
-        
-        logger.info("🚀 UmbraSIL Bot initialized successfully with all modules")
-        logger.info(f"📊 Active modules: Finance={ENABLE_FINANCE}, Business={ENABLE_BUSINESS}, AI={ENABLE_AI}, Monitoring={ENABLE_MONITORING}")
-    
-    def setup_handlers(self):
-        """Setup bot handlers with authentication"""
+        # Texts and keyboards that depend on which modules are operational
+        self.welcome_template = self._build_welcome_template()
+        self.help_text = self._build_help_text()
+        self.ai_menu_text = self._build_ai_menu_text()
+        self.start_markup = self._build_start_markup()
+        self.main_menu_markup = self._build_main_menu_markup()
         
-        # Core handlers
-        self.application.add_handler(
-            CommandHandler("start", self.require_auth(self.start_command))
-        )
-        self.application.add_handler(
-            CommandHandler("help", self.require_auth(self.help_command))
-        )
-        self.application.add_handler(
-            CommandHandler("status", self.require_auth(self.status_command))
-        )
-        self.application.add_handler(
-            CommandHandler("menu", self.require_auth(self.main_menu_command))
-        )
-        
-        # Module-specific commands
-        if ENABLE_AI:
-            self.application.add_handler(
-                CommandHandler("ai", self.require_auth(self.ai_command))
-            )
-        
-        if ENABLE_FINANCE:
-            self.application.add_handler(
-                CommandHandler("finance", self.require_auth(self.finance_command))
-            )
-        
-        if ENABLE_BUSINESS:
-            self.application.add_handler(
-                CommandHandler("business", self.require_auth(self.business_command))
-            )
-        
-        # Button handler
-        self.application.add_handler(
-            CallbackQueryHandler(self.require_auth(self.button_handler))
-        )
-        
-        # Text message handler
-        self.application.add_handler(
-            MessageHandler(
-                filters.TEXT & ~filters.COMMAND,
-                self.require_auth(self.handle_text_message)
-            )
-        )
+        # Callback data -> handler, or (text, reply_markup) for static replies
+        self.callback_routes = {
+            # Main navigation
+            "main_menu": self.main_menu_command,
+            "show_help": self.help_command,
+            "system_status": self.show_system_status,
+            "bot_info": self.show_bot_info,
+            
+            # Module menus
+            "ai_menu": self.show_ai_menu,
+            "finance_menu": self.show_finance_menu,
+            "business_menu": self.show_business_menu,
+            "monitoring_menu": self.show_monitoring_menu,
+            
+            # AI module actions
+            "ai_ask": (AI_ASK_TEXT, BACK_TO_MENU_MARKUP),
+            "ai_clear": self.clear_ai_context,
+            
+            # Finance module actions
+            "finance_expense": (EXPENSE_HELP_TEXT, BACK_TO_FINANCE_MARKUP),
+            "finance_income": (INCOME_HELP_TEXT, BACK_TO_FINANCE_MARKUP),
+            "finance_balance": self.show_finance_menu,
+            "finance_report": self.show_finance_report,
+            
+            # Business module actions
+            "business_docker": self.show_docker_status,
+            "business_vps": self.show_vps_status,
+            "business_metrics": self.show_system_status,
+            "business_services": (BUSINESS_SERVICES_TEXT, BACK_TO_BUSINESS_MARKUP),
+            
+            # Monitoring module actions
+            "monitoring_metrics": self.show_monitoring_metrics,
+            "monitoring_alerts": self.show_monitoring_alerts,
+            "monitoring_health": self.show_monitoring_menu,
+            "monitoring_logs": (MONITORING_LOGS_TEXT, BACK_TO_MONITORING_MARKUP),
+        }
         
-        # Photo handler for receipts
-        self.application.add_handler(
-            MessageHandler(
-                filters.PHOTO,
-                self.require_auth(self.handle_photo_message)
-            )
+        # Create application
+        self.application = (
+            Application.builder()
+            .token(self.token)
+            .concurrent_updates(ChatOrderedUpdateProcessor(MAX_CONCURRENT_UPDATES))
+            .rate_limiter(RetryingRateLimiter())
+            .post_init(self.post_init)
+            .post_shutdown(self.post_shutdown)
+            .build()
         )
+        self.setup_handlers()
         
-        # Error handler
-        self.application.add_error_handler(self.handle_error)
-        
-        logger.info("✅ All handlers setup completed")
-    
-    def require_auth(self, func):
-        """Authentication decorator"""
-        async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE):
-            if not update.effective_user:
-                return
-                
-            user_id = update.effective_user.id
-            if not await self.auth.authenticate_user(user_id):
-                message = "🚫 Access denied. You are not authorized to use this bot."
-                if update.message:
-                    await update.message.reply_text(message)
-                elif update.callback_query:
-                    await update.callback_query.answer(message, show_alert=True)
-                return
-                
-            return await func(update, context)
-        return wrapper
+        logger.info("🚀 UmbraSIL Bot initialized successfully with all modules")
+        logger.info("📊 Active modules: Finance=%s, Business=%s, AI=%s, Monitoring=%s", ENABLE_FINANCE, ENABLE_BUSINESS, ENABLE_AI, ENABLE_MONITORING)
     
-    async def start_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /start command"""
-        user = update.effective_user
-        self.metrics.log_user_activity(user.id)
-        
-        # Build feature list dynamically
+    def _build_welcome_template(self) -> str:
+        """Welcome text listing the operational modules; formatted with first_name"""
         features = ["• System monitoring", "• Interactive menus", "• Help and status information"]
         
         if ENABLE_AI and self.ai_manager.is_operational():
@@ -495,8 +954,8 @@ class UmbraSILBot:
         if ENABLE_MONITORING and self.monitoring_manager.is_operational():
             features.append("• 📊 Advanced Monitoring")
         
-        welcome_text = f"""
-🤖 **Welcome {user.first_name}! I'm UmbraSIL v{BOT_VERSION}**
+        return f"""
+🤖 **Welcome {{first_name}}! I'm UmbraSIL v{BOT_VERSION}**
 
 Your intelligent bot assistant is ready with full features!
 
@@ -506,7 +965,85 @@ Your intelligent bot assistant is ready with full features!
 💬 **Get Started:**
 Use the buttons below or type /help for detailed information.
 """
+    
+    def _build_ai_menu_text(self) -> str:
+        """AI menu text; provider clients are fixed once the AI manager is built"""
+        return f"""
+🤖 **AI Assistant**
+
+Available AI providers:
+• OpenAI: {CHECK_MARKS[self.ai_manager.openai_client is not None]}
+• Claude: {CHECK_MARKS[self.ai_manager.anthropic_client is not None]}
+
+Choose an action:
+"""
+    
+    def _build_help_text(self) -> str:
+        """Help text covering the operational modules"""
+        ai_ready = ENABLE_AI and self.ai_manager.is_operational()
+        finance_ready = ENABLE_FINANCE and self.finance_manager.is_operational()
+        business_ready = ENABLE_BUSINESS and self.business_manager.is_operational()
+        
+        lines = [
+            "",
+            f"📚 **UmbraSIL v{BOT_VERSION} Help**",
+            "",
+            "**🔧 Basic Commands:**",
+            "• /start - Start the bot and see welcome",
+            "• /help - Show this help",
+            "• /status - System status and metrics",
+            "• /menu - Main navigation menu",
+            "",
+            "**🎯 Module Commands:**",
+        ]
         
+        if ai_ready:
+            lines.append("• /ai - Access AI Assistant")
+        
+        if finance_ready:
+            lines.append("• /finance - Finance management")
+        
+        if business_ready:
+            lines.append("• /business - Business operations")
+        
+        lines.extend([
+            "",
+            "**🚀 Key Features:**",
+            "• 📊 **System Monitoring** - Real-time resource tracking",
+            "• 🔧 **Interactive Menus** - Easy button navigation",
+            "• 🛡️ **Secure Access** - User authentication",
+        ])
+        
+        if ai_ready:
+            lines.append("• 🤖 **AI Assistant** - OpenAI/Claude integration")
+        
+        if finance_ready:
+            lines.append("• 💰 **Finance Manager** - Track income & expenses")
+        
+        if business_ready:
+            lines.append("• ⚙️ **Business Ops** - Docker & VPS management")
+        
+        lines.extend([
+            "",
+            "**💬 Text Interactions:**",
+            "• Type naturally for basic responses",
+            "• Use 'ai: your question' for AI chat",
+            "• Use 'expense: amount category desc' to log expenses",
+            "• Use 'income: amount source desc' to log income",
+            "",
+            "**🎮 Getting Started:**",
+            "1. Use /start to see all available features",
+            "2. Navigate with buttons or commands",
+            "3. Try 'ai: hello' if AI is enabled",
+            "4. Use /menu anytime for main navigation",
+            "",
+            "**Ready for Railway deployment! 🚀**",
+            "",
+        ])
+        return "\n".join(lines)
+    
+    def _build_start_markup(self) -> InlineKeyboardMarkup:
+        """Welcome keyboard with shortcuts for the operational modules"""
         keyboard = [
             [
                 InlineKeyboardButton("📊 System Status", callback_data="system_status"),
@@ -526,93 +1063,10 @@ Use the buttons below or type /help for detailed information.
             keyboard.append(module_buttons[:2])  # Max 2 buttons per row
         
         keyboard.append([InlineKeyboardButton("❓ Help", callback_data="show_help")])
-        
-        await update.message.reply_text(
-            welcome_text,
-            parse_mode='Markdown',
-            reply_markup=InlineKeyboardMarkup(keyboard)
-        )
-        
-        self.metrics.log_command(1.0)
-    
-    async def help_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /help command"""
-        
-        # Build help text dynamically based on enabled modules
-        help_text = f"""
-📚 **UmbraSIL v{BOT_VERSION} Help**
-
-**🔧 Basic Commands:**
-• /start - Start the bot and see welcome
-• /help - Show this help
-• /status - System status and metrics
-• /menu - Main navigation menu
-
-**🎯 Module Commands:**"""
-
-        if ENABLE_AI and self.ai_manager.is_operational():
-            help_text += "\n• /ai - Access AI Assistant"
-        
-        if ENABLE_FINANCE and self.finance_manager.is_operational():
-            help_text += "\n• /finance - Finance management"
-        
-        if ENABLE_BUSINESS and self.business_manager.is_operational():
-            help_text += "\n• /business - Business operations"
-
-        help_text += f"""
-
-**🚀 Key Features:**
-• 📊 **System Monitoring** - Real-time resource tracking
-• 🔧 **Interactive Menus** - Easy button navigation
-• 🛡️ **Secure Access** - User authentication"""
-
-        if ENABLE_AI and self.ai_manager.is_operational():
-            help_text += "\n• 🤖 **AI Assistant** - OpenAI/Claude integration"
-        
-        if ENABLE_FINANCE and self.finance_manager.is_operational():
-            help_text += "\n• 💰 **Finance Manager** - Track income & expenses"
-        
-        if ENABLE_BUSINESS and self.business_manager.is_operational():
-            help_text += "\n• ⚙️ **Business Ops** - Docker & VPS management"
-
-        help_text += """
-
-**💬 Text Interactions:**
-• Type naturally for basic responses
-• Use 'ai: your question' for AI chat
-• Use 'expense: amount category desc' to log expenses
-• Use 'income: amount source desc' to log income
-
-**🎮 Getting Started:**
-1. Use /start to see all available features
-2. Navigate with buttons or commands
-3. Try 'ai: hello' if AI is enabled
-4. Use /menu anytime for main navigation
-
-**Ready for Railway deployment! 🚀**
-"""
-        
-        keyboard = [
-            [
-                InlineKeyboardButton("🏠 Main Menu", callback_data="main_menu"),
-                InlineKeyboardButton("📊 Status", callback_data="system_status")
-            ]
-        ]
-        
-        await update.message.reply_text(
-            help_text,
-            parse_mode='Markdown',
-            reply_markup=InlineKeyboardMarkup(keyboard)
-        )
+        return InlineKeyboardMarkup(keyboard)
     
-    async def status_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /status command"""
-        await self.show_system_status(update, context)
-    
-    async def main_menu_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /menu command"""
-        menu_text = f"🏠 **Main Menu** - UmbraSIL v{BOT_VERSION}\n\nChoose an option:"
-        
+    def _build_main_menu_markup(self) -> InlineKeyboardMarkup:
+        """Main menu keyboard with entries for the operational modules"""
         keyboard = [
             [
                 InlineKeyboardButton("📊 System Status", callback_data="system_status"),
@@ -641,19 +1095,129 @@ Use the buttons below or type /help for detailed information.
         if module_row2:
             keyboard.append(module_row2)
         
-        keyboard.extend([
-            [
-                InlineKeyboardButton("❓ Help", callback_data="show_help"),
-                InlineKeyboardButton("🔄 Refresh", callback_data="main_menu")
-            ]
+        keyboard.append([
+            InlineKeyboardButton("❓ Help", callback_data="show_help"),
+            InlineKeyboardButton("🔄 Refresh", callback_data="main_menu")
+        ])
+        return InlineKeyboardMarkup(keyboard)
+    
+    def setup_handlers(self):
+        """Setup bot handlers with authentication"""
+        
+        # Core handlers
+        handlers = [
+            CommandHandler("start", self.start_command),
+            CommandHandler("help", self.help_command),
+            CommandHandler("status", self.status_command),
+            CommandHandler("menu", self.main_menu_command)
+        ]
+        
+        # Module-specific commands
+        if ENABLE_AI:
+            handlers.append(CommandHandler("ai", self.ai_command))
+        
+        if ENABLE_FINANCE:
+            handlers.append(CommandHandler("finance", self.finance_command))
+        
+        if ENABLE_BUSINESS:
+            handlers.append(CommandHandler("business", self.business_command))
+        
+        handlers.extend([
+            # Button handler
+            CallbackQueryHandler(self.button_handler),
+            # Text message handler
+            MessageHandler(filters.TEXT & ~filters.COMMAND, self.handle_text_message),
+            # Photo handler for receipts
+            MessageHandler(filters.PHOTO, self.handle_photo_message)
         ])
         
-        reply_markup = InlineKeyboardMarkup(keyboard)
+        self.application.add_handlers({
+            # Authentication gate - runs before every other handler group
+            -1: [TypeHandler(Update, self.auth_gate)],
+            0: handlers
+        })
+        
+        # Error handler - non-blocking, so sending an error notice never holds up the next update
+        self.application.add_error_handler(self.handle_error, block=False)
         
+        logger.info("✅ All handlers setup completed")
+    
+    async def post_init(self, application: Application):
+        """Publish the command list to Telegram in one request before polling starts"""
+        commands = [
+            BotCommand("start", "Start the bot and see welcome"),
+            BotCommand("help", "Show help"),
+            BotCommand("status", "System status and metrics"),
+            BotCommand("menu", "Main navigation menu")
+        ]
+        if ENABLE_AI:
+            commands.append(BotCommand("ai", "Access AI Assistant"))
+        if ENABLE_FINANCE:
+            commands.append(BotCommand("finance", "Finance management"))
+        if ENABLE_BUSINESS:
+            commands.append(BotCommand("business", "Business operations"))
+        
+        try:
+            await application.bot.set_my_commands(commands)
+        except Exception as e:
+            logger.warning("Could not set bot commands: %s", e)
+    
+    async def post_shutdown(self, application: Application):
+        """Release pooled HTTP and SSH connections"""
+        if self.nlp_manager:
+            await self.nlp_manager.close()
+        await asyncio.to_thread(self.business_manager.close)
+    
+    async def auth_gate(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Reject updates from unauthorized users before any handler runs"""
+        if update.effective_user and self.auth.authenticate_user(update.effective_user.id):
+            return
+        
+        if update.effective_user:
+            message = "🚫 Access denied. You are not authorized to use this bot."
+            if update.message:
+                await update.message.reply_text(message)
+            elif update.callback_query:
+                await update.callback_query.answer(message, show_alert=True)
+        raise ApplicationHandlerStop
+    
+    async def send_screen(self, update: Update, text: str, reply_markup: InlineKeyboardMarkup, parse_mode: Optional[str] = 'Markdown'):
+        """Reply to a command, or edit the message behind a button press"""
         if update.message:
-            await update.message.reply_text(menu_text, parse_mode='Markdown', reply_markup=reply_markup)
+            await update.message.reply_text(text, parse_mode=parse_mode, reply_markup=reply_markup)
         elif update.callback_query:
-            await update.callback_query.edit_message_text(menu_text, parse_mode='Markdown', reply_markup=reply_markup)
+            try:
+                await update.callback_query.edit_message_text(text, parse_mode=parse_mode, reply_markup=reply_markup)
+            except BadRequest as e:
+                # Repeated refreshes often render the same screen; that is not a failure
+                if "not modified" not in str(e).lower():
+                    raise
+    
+    async def start_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle /start command"""
+        started = time.perf_counter()
+        user = update.effective_user
+        self.metrics.log_user_activity(user.id)
+        
+        await update.message.reply_text(
+            self.welcome_template.format(first_name=user.first_name),
+            parse_mode='Markdown',
+            reply_markup=self.start_markup
+        )
+        
+        self.metrics.log_command(time.perf_counter() - started)
+    
+    async def help_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle /help command"""
+        await self.send_screen(update, self.help_text, HELP_MARKUP)
+    
+    async def status_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle /status command"""
+        await self.show_system_status(update, context)
+    
+    async def main_menu_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle /menu command"""
+        await self.send_screen(update, MAIN_MENU_TEXT, self.main_menu_markup)
     
     async def ai_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /ai command"""
@@ -683,33 +1247,12 @@ Use the buttons below or type /help for detailed information.
         """Show AI Assistant menu"""
         if not self.ai_manager.is_operational():
             text = "🤖 **AI Assistant**\n\nAI services are not configured. Please add your API keys."
-            keyboard = [[InlineKeyboardButton("🏠 Main Menu", callback_data="main_menu")]]
+            reply_markup = BACK_TO_MAIN_MARKUP
         else:
-            text = f"""
-🤖 **AI Assistant**
-
-Available AI providers:
-• OpenAI: {'✅' if self.ai_manager.openai_client else '❌'}
-• Claude: {'✅' if self.ai_manager.anthropic_client else '❌'}
-
-Choose an action:
-"""
-            keyboard = [
-                [
-                    InlineKeyboardButton("💬 Ask Question", callback_data="ai_ask"),
-                    InlineKeyboardButton("🧹 Clear Context", callback_data="ai_clear")
-                ],
-                [
-                    InlineKeyboardButton("🏠 Main Menu", callback_data="main_menu")
-                ]
-            ]
+            text = self.ai_menu_text
+            reply_markup = AI_MENU_MARKUP
         
-        reply_markup = InlineKeyboardMarkup(keyboard)
-        
-        if update.message:
-            await update.message.reply_text(text, parse_mode='Markdown', reply_markup=reply_markup)
-        elif update.callback_query:
-            await update.callback_query.edit_message_text(text, parse_mode='Markdown', reply_markup=reply_markup)
+        await self.send_screen(update, text, reply_markup)
     
     async def show_finance_menu(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Show Finance menu"""
@@ -729,31 +1272,11 @@ Choose an action:
 Choose an action:
 """
         
-        keyboard = [
-            [
-                InlineKeyboardButton("💸 Add Expense", callback_data="finance_expense"),
-                InlineKeyboardButton("💰 Add Income", callback_data="finance_income")
-            ],
-            [
-                InlineKeyboardButton("📊 View Balance", callback_data="finance_balance"),
-                InlineKeyboardButton("📈 Generate Report", callback_data="finance_report")
-            ],
-            [
-                InlineKeyboardButton("🏠 Main Menu", callback_data="main_menu")
-            ]
-        ]
-        
-        reply_markup = InlineKeyboardMarkup(keyboard)
-        
-        if update.message:
-            await update.message.reply_text(text, parse_mode='Markdown', reply_markup=reply_markup)
-        elif update.callback_query:
-            await update.callback_query.edit_message_text(text, parse_mode='Markdown', reply_markup=reply_markup)
+        await self.send_screen(update, text, FINANCE_MENU_MARKUP)
     
     async def show_business_menu(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Show Business Operations menu"""
-        docker_status = await self.business_manager.get_docker_status()
-        vps_status = await self.business_manager.get_vps_status()
+        docker_status, vps_status = await self.business_manager.get_overview()
         
         text = f"""
 ⚙️ **Business Operations**
@@ -767,74 +1290,29 @@ Choose an action:
 Choose an action:
 """
         
-        keyboard = [
-            [
-                InlineKeyboardButton("🐳 Docker Status", callback_data="business_docker"),
-                InlineKeyboardButton("🖥️ VPS Status", callback_data="business_vps")
-            ],
-            [
-                InlineKeyboardButton("📊 System Metrics", callback_data="business_metrics"),
-                InlineKeyboardButton("🔧 Services", callback_data="business_services")
-            ],
-            [
-                InlineKeyboardButton("🏠 Main Menu", callback_data="main_menu")
-            ]
-        ]
-        
-        reply_markup = InlineKeyboardMarkup(keyboard)
-        
-        if update.message:
-            await update.message.reply_text(text, parse_mode='Markdown', reply_markup=reply_markup)
-        elif update.callback_query:
-            await update.callback_query.edit_message_text(text, parse_mode='Markdown', reply_markup=reply_markup)
+        await self.send_screen(update, text, BUSINESS_MENU_MARKUP)
     
     async def show_monitoring_menu(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Show Monitoring menu"""
         health = await self.monitoring_manager.check_system_health()
         
-        status_emoji = "✅" if health.get("status") == "healthy" else "⚠️" if health.get("status") == "warning" else "❌"
-        
-        text = f"""
-📊 **System Monitoring**
-
-{status_emoji} **System Status**: {health.get('status', 'unknown').title()}
-
-📈 **Current Metrics**:
-• CPU: {health.get('cpu_percent', 0):.1f}%
-• Memory: {health.get('memory_percent', 0):.1f}%
-• Disk: {health.get('disk_percent', 0):.1f}%
-
-🚨 **Active Alerts**: {len(health.get('alerts', []))}
-
-Choose an action:
-"""
-        
-        keyboard = [
-            [
-                InlineKeyboardButton("📈 System Metrics", callback_data="monitoring_metrics"),
-                InlineKeyboardButton("🚨 View Alerts", callback_data="monitoring_alerts")
-            ],
-            [
-                InlineKeyboardButton("❤️ Health Check", callback_data="monitoring_health"),
-                InlineKeyboardButton("📋 System Logs", callback_data="monitoring_logs")
-            ],
-            [
-                InlineKeyboardButton("🏠 Main Menu", callback_data="main_menu")
-            ]
-        ]
-        
-        reply_markup = InlineKeyboardMarkup(keyboard)
+        text = MONITORING_MENU_TEMPLATE.format(
+            status_emoji=HEALTH_STATUS_EMOJI.get(health.get("status"), "❌"),
+            status=health.get('status', 'unknown').title(),
+            cpu_percent=health.get('cpu_percent', 0),
+            memory_percent=health.get('memory_percent', 0),
+            disk_percent=health.get('disk_percent', 0),
+            alert_count=len(health.get('alerts', []))
+        )
         
-        if update.message:
-            await update.message.reply_text(text, parse_mode='Markdown', reply_markup=reply_markup)
-        elif update.callback_query:
-            await update.callback_query.edit_message_text(text, parse_mode='Markdown', reply_markup=reply_markup)
+        await self.send_screen(update, text, MONITORING_MENU_MARKUP)
     
     async def handle_text_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle text messages with NLP understanding"""
         if not update.message or not update.message.text:
             return
         
+        started = time.perf_counter()
         user_text = update.message.text.strip()
         user_text_lower = user_text.lower()
         
@@ -872,7 +1350,7 @@ Choose an action:
                         response_text += f"💳 New balance: {self.finance_manager.balance:.2f} {self.finance_manager.currency}"
                         
                         await update.message.reply_text(response_text, parse_mode='Markdown')
-                        self.metrics.log_command(1.0, "finance")
+                        self.metrics.log_command(time.perf_counter() - started, "finance")
                         return
                     else:
                         await update.message.reply_text("❌ Failed to add expense. Please try again.")
@@ -893,7 +1371,7 @@ Choose an action:
                         response_text += f"💳 New balance: {self.finance_manager.balance:.2f} {self.finance_manager.currency}"
                         
                         await update.message.reply_text(response_text, parse_mode='Markdown')
-                        self.metrics.log_command(1.0, "finance")
+                        self.metrics.log_command(time.perf_counter() - started, "finance")
                         return
                     else:
                         await update.message.reply_text("❌ Failed to add income. Please try again.")
@@ -927,7 +1405,7 @@ Choose an action:
             try:
                 ai_response = await self.ai_manager.get_ai_response(update.effective_user.id, question)
                 await update.message.reply_text(f"🤖 **AI Response:**\n\n{ai_response}", parse_mode='Markdown')
-                self.metrics.log_command(1.0, "ai")
+                self.metrics.log_command(time.perf_counter() - started, "ai")
                 return
             except Exception as e:
                 await update.message.reply_text(f"🤖 Error getting AI response: {str(e)[:100]}")
@@ -951,7 +1429,7 @@ Choose an action:
                                 f"💸 **Expense Added**\n\n• Amount: {amount:.2f} {self.finance_manager.currency}\n• Category: {category}\n• Description: {description}\n\nUse /finance to see your balance.",
                                 parse_mode='Markdown'
                             )
-                            self.metrics.log_command(1.0, "finance")
+                            self.metrics.log_command(time.perf_counter() - started, "finance")
                         else:
                             await update.message.reply_text("❌ Failed to add expense. Please try again.")
                     else:
@@ -976,7 +1454,7 @@ Choose an action:
                                 f"💰 **Income Added**\n\n• Amount: {amount:.2f} {self.finance_manager.currency}\n• Source: {source}\n• Description: {description}\n\nUse /finance to see your balance.",
                                 parse_mode='Markdown'
                             )
-                            self.metrics.log_command(1.0, "finance")
+                            self.metrics.log_command(time.perf_counter() - started, "finance")
                         else:
                             await update.message.reply_text("❌ Failed to add income. Please try again.")
                     else:
@@ -1023,150 +1501,51 @@ Choose an action:
         """Show system status"""
         try:
             # Get basic system info
-            cpu_percent = psutil.cpu_percent(interval=1)
-            memory = psutil.virtual_memory()
-            disk = psutil.disk_usage('/')
+            metrics = await self.monitoring_manager.get_system_metrics()
+            snapshot = self.metrics.get_snapshot()
             
-            status_text = f"""
-📊 **System Status**
-
-🤖 **Bot Info**:
-• Version: {BOT_VERSION}
-• Commands: {self.metrics.command_count}
-• Success Rate: {self.metrics.get_success_rate():.1f}%
-• Uptime: {self.metrics.get_uptime()}
-
-⚙️ **System Resources**:
-• CPU: {cpu_percent}%
-• Memory: {memory.percent}%
-• Disk: {disk.percent}%
-• Platform: {platform.system()}
-
-✅ **Status**: All systems operational!
-"""
-            
-            keyboard = [
-                [
-                    InlineKeyboardButton("🔄 Refresh", callback_data="system_status"),
-                    InlineKeyboardButton("🏠 Menu", callback_data="main_menu")
-                ]
-            ]
+            status_text = STATUS_TEMPLATE.format_map({
+                **snapshot,
+                **metrics,
+                "uptime": self.metrics.get_uptime()
+            })
             
-            if update.message:
-                await update.message.reply_text(status_text, parse_mode='Markdown', reply_markup=InlineKeyboardMarkup(keyboard))
-            elif update.callback_query:
-                await update.callback_query.edit_message_text(status_text, parse_mode='Markdown', reply_markup=InlineKeyboardMarkup(keyboard))
+            await self.send_screen(update, status_text, STATUS_MARKUP)
         
         except Exception as e:
-            logger.error(f"System status error: {e}")
+            logger.error("System status error: %s", e)
             error_text = f"❌ Error getting status: {str(e)[:200]}"
-            keyboard = [[InlineKeyboardButton("🏠 Menu", callback_data="main_menu")]]
-            
-            if update.message:
-                await update.message.reply_text(error_text, reply_markup=InlineKeyboardMarkup(keyboard))
-            elif update.callback_query:
-                await update.callback_query.edit_message_text(error_text, reply_markup=InlineKeyboardMarkup(keyboard))
+            await self.send_screen(update, error_text, BACK_TO_MENU_MARKUP, parse_mode=None)
     
     async def show_bot_info(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Show bot information"""
-        info_text = f"""
-ℹ️ **Bot Information**
-
-🤖 **UmbraSIL Bot**
-• Version: {BOT_VERSION}
-• Created: 2025
-• Purpose: Personal VPS Assistant
-
-📈 **Current Session**:
-• Started: {self.metrics.start_time.strftime('%H:%M:%S UTC')}
-• Uptime: {self.metrics.get_uptime()}
-• Commands Processed: {self.metrics.command_count}
-• Active Users: {len(self.metrics.active_users)}
-
-🔧 **Features**:
-• Secure user authentication
-• System resource monitoring
-• Interactive menu navigation
-• Error handling and logging
-
-✨ **Status**: Running smoothly!
-"""
-        
-        keyboard = [
-            [
-                InlineKeyboardButton("📊 System Status", callback_data="system_status"),
-                InlineKeyboardButton("🏠 Menu", callback_data="main_menu")
-            ]
-        ]
+        snapshot = self.metrics.get_snapshot()
+        info_text = BOT_INFO_TEMPLATE.format_map({
+            **snapshot,
+            "start_time": self.metrics.start_time_text,
+            "uptime": self.metrics.get_uptime(),
+            "active_users": self.metrics.get_active_users_count()
+        })
         
         await update.callback_query.edit_message_text(
             info_text,
             parse_mode='Markdown',
-            reply_markup=InlineKeyboardMarkup(keyboard)
+            reply_markup=BOT_INFO_MARKUP
         )
     
-    async def button_handler(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle button callbacks"""
-        query = update.callback_query
-        await query.answer()
-        
-        try:
-            callback_data = query.data
-            
-            # Main navigation
-            if callback_data == "main_menu":
-                await self.main_menu_command(update, context)
-            elif callback_data == "show_help":
-                await self.help_command(update, context)
-            elif callback_data == "system_status":
-                await self.show_system_status(update, context)
-            elif callback_data == "bot_info":
-                await self.show_bot_info(update, context)
-            
-            # Module menus
-            elif callback_data == "ai_menu":
-                await self.show_ai_menu(update, context)
-            elif callback_data == "finance_menu":
-                await self.show_finance_menu(update, context)
-            elif callback_data == "business_menu":
-                await self.show_business_menu(update, context)
-            elif callback_data == "monitoring_menu":
-                await self.show_monitoring_menu(update, context)
-            
-            # AI module actions
-            elif callback_data == "ai_ask":
-                await query.edit_message_text(
-                    "🤖 **AI Assistant**\n\nType your question in the chat or use format:\n`ai: your question here`\n\nExample: `ai: What's the best way to manage my finances?`",
-                    parse_mode='Markdown',
-                    reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("🏠 Menu", callback_data="main_menu")]])
-                )
-            elif callback_data == "ai_clear":
-                # Clear AI context
-                if hasattr(self.ai_manager, 'context_storage'):
-                    self.ai_manager.context_storage.clear()
-                await query.edit_message_text(
-                    "🧹 **AI Context Cleared**\n\nAll conversation history has been cleared.",
-                    reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("🤖 AI Menu", callback_data="ai_menu")]])
-                )
-            
-            # Finance module actions
-            elif callback_data == "finance_expense":
-                await query.edit_message_text(
-                    "💸 **Add Expense**\n\nTo add an expense, use the format:\n`expense: amount category description`\n\nExample: `expense: 25.50 food Pizza for lunch`",
-                    parse_mode='Markdown',
-                    reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("💰 Finance Menu", callback_data="finance_menu")]])
-                )
-            elif callback_data == "finance_income":
-                await query.edit_message_text(
-                    "💰 **Add Income**\n\nTo add income, use the format:\n`income: amount source description`\n\nExample: `income: 2500 salary Monthly salary`",
-                    parse_mode='Markdown',
-                    reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("💰 Finance Menu", callback_data="finance_menu")]])
-                )
-            elif callback_data == "finance_balance":
-                await self.show_finance_menu(update, context)
-            elif callback_data == "finance_report":
-                balance_info = await self.finance_manager.get_balance()
-                report_text = f"""
+    async def clear_ai_context(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Clear AI conversation context"""
+        if hasattr(self.ai_manager, 'context_storage'):
+            self.ai_manager.context_storage.clear()
+        await update.callback_query.edit_message_text(
+            "🧹 **AI Context Cleared**\n\nAll conversation history has been cleared.",
+            reply_markup=BACK_TO_AI_MARKUP
+        )
+    
+    async def show_finance_report(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Show finance report"""
+        balance_info = await self.finance_manager.get_balance()
+        report_text = f"""
 📈 **Finance Report**
 
 💳 **Current Balance**: {balance_info['balance']:.2f} {balance_info['currency']}
@@ -1177,59 +1556,47 @@ Choose an action:
 • Today's Expenses: -{balance_info['today_expenses']:.2f}
 • Net Today: {balance_info['today_income'] - balance_info['today_expenses']:.2f}
 
-📅 **Last Updated**: {datetime.now().strftime('%Y-%m-%d %H:%M')}
-"""
-                await query.edit_message_text(
-                    report_text,
-                    parse_mode='Markdown',
-                    reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("💰 Finance Menu", callback_data="finance_menu")]])
-                )
-            
-            # Business module actions
-            elif callback_data == "business_docker":
-                docker_status = await self.business_manager.get_docker_status()
-                if 'error' in docker_status:
-                    status_text = f"🐳 **Docker Status**\n\n❌ Error: {docker_status['error']}"
-                else:
-                    status_text = f"""
-🐳 **Docker Status**
-
-📊 **Container Summary**:
-• Total: {docker_status['total_containers']}
-• Running: {docker_status['running']}
-• Stopped: {docker_status['stopped']}
-
-📋 **Recent Containers**:
-{chr(10).join([f"• {c['name']}: {c['status']}" for c in docker_status.get('containers', [])[:5]])}
+📅 **Last Updated**: {datetime.now().isoformat(sep=' ', timespec='minutes')}
 """
-                await query.edit_message_text(
-                    status_text,
-                    parse_mode='Markdown',
-                    reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⚙️ Business Menu", callback_data="business_menu")]])
-                )
-            elif callback_data == "business_vps":
-                vps_status = await self.business_manager.get_vps_status()
-                if 'error' in vps_status:
-                    status_text = f"🖥️ **VPS Status**\n\n❌ Error: {vps_status['error']}"
-                else:
-                    status_text = f"🖥️ **VPS Status**\n\n✅ Connected\n\n```\n{vps_status['info']}\n```"
-                await query.edit_message_text(
-                    status_text,
-                    parse_mode='Markdown',
-                    reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⚙️ Business Menu", callback_data="business_menu")]])
-                )
-            elif callback_data == "business_metrics":
-                await self.show_system_status(update, context)
-            elif callback_data == "business_services":
-                await query.edit_message_text(
-                    "🔧 **Business Services**\n\nService management features:\n• n8n workflow automation\n• Docker container management\n• VPS monitoring\n• System metrics\n\nUse the business menu to access specific services.",
-                    reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⚙️ Business Menu", callback_data="business_menu")]])
-                )
-            
-            # Monitoring module actions
-            elif callback_data == "monitoring_metrics":
-                health = await self.monitoring_manager.check_system_health()
-                metrics_text = f"""
+        await update.callback_query.edit_message_text(
+            report_text,
+            parse_mode='Markdown',
+            reply_markup=BACK_TO_FINANCE_MARKUP
+        )
+    
+    async def show_docker_status(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Show Docker container status"""
+        docker_status = await self.business_manager.get_docker_status()
+        if 'error' in docker_status:
+            status_text = f"🐳 **Docker Status**\n\n❌ Error: {docker_status['error']}"
+        else:
+            status_text = DOCKER_STATUS_TEMPLATE.format_map({
+                **docker_status,
+                "containers": "\n".join(f"• {c['name']}: {c['status']}" for c in docker_status.get('containers', [])[:5])
+            })
+        await update.callback_query.edit_message_text(
+            status_text,
+            parse_mode='Markdown',
+            reply_markup=BACK_TO_BUSINESS_MARKUP
+        )
+    
+    async def show_vps_status(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Show VPS status"""
+        vps_status = await self.business_manager.get_vps_status()
+        if 'error' in vps_status:
+            status_text = f"🖥️ **VPS Status**\n\n❌ Error: {vps_status['error']}"
+        else:
+            status_text = f"🖥️ **VPS Status**\n\n✅ Connected\n\n```\n{vps_status['info']}\n```"
+        await update.callback_query.edit_message_text(
+            status_text,
+            parse_mode='Markdown',
+            reply_markup=BACK_TO_BUSINESS_MARKUP
+        )
+    
+    async def show_monitoring_metrics(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Show system metrics against alert thresholds"""
+        health = await self.monitoring_manager.check_system_health()
+        metrics_text = f"""
 📈 **System Metrics**
 
 ⚙️ **Resource Usage**:
@@ -1244,54 +1611,68 @@ Choose an action:
 
 📊 **Status**: {health.get('status', 'unknown').title()}
 """
-                await query.edit_message_text(
-                    metrics_text,
-                    parse_mode='Markdown',
-                    reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("📊 Monitoring Menu", callback_data="monitoring_menu")]])
-                )
-            elif callback_data == "monitoring_alerts":
-                health = await self.monitoring_manager.check_system_health()
-                alerts = health.get('alerts', [])
-                alerts_text = f"""
+        await update.callback_query.edit_message_text(
+            metrics_text,
+            parse_mode='Markdown',
+            reply_markup=BACK_TO_MONITORING_MARKUP
+        )
+    
+    async def show_monitoring_alerts(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Show active system alerts"""
+        health = await self.monitoring_manager.check_system_health()
+        alerts = health.get('alerts', [])
+        alerts_text = f"""
 🚨 **System Alerts**
 
 📊 **Active Alerts**: {len(alerts)}
 
 {chr(10).join([f"⚠️ {alert}" for alert in alerts]) if alerts else "✅ No active alerts"}
 
-🔔 **Alert Thresholds**:
-• CPU: {self.monitoring_manager.thresholds['cpu']}%
-• Memory: {self.monitoring_manager.thresholds['memory']}%
-• Disk: {self.monitoring_manager.thresholds['disk']}%
+{self.monitoring_manager.thresholds_text}
 """
-                await query.edit_message_text(
-                    alerts_text,
-                    parse_mode='Markdown',
-                    reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("📊 Monitoring Menu", callback_data="monitoring_menu")]])
-                )
-            elif callback_data == "monitoring_health":
-                await self.show_monitoring_menu(update, context)
-            elif callback_data == "monitoring_logs":
-                await query.edit_message_text(
-                    "📋 **System Logs**\n\nRecent bot activity:\n• Bot started successfully\n• All modules initialized\n• System monitoring active\n\nFor detailed logs, check your hosting platform's log viewer.",
-                    reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("📊 Monitoring Menu", callback_data="monitoring_menu")]])
-                )
+        await update.callback_query.edit_message_text(
+            alerts_text,
+            parse_mode='Markdown',
+            reply_markup=BACK_TO_MONITORING_MARKUP
+        )
+    
+    async def button_handler(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle button callbacks"""
+        query = update.callback_query
+        # Acknowledge the press while the reply is rendered instead of
+        # waiting for the answerCallbackQuery round-trip first
+        answer_task = asyncio.create_task(query.answer())
+        
+        try:
+            callback_data = query.data
+            route = self.callback_routes.get(callback_data)
             
+            if callable(route):
+                await route(update, context)
+            elif route:
+                # Static reply: (text, reply_markup)
+                text, reply_markup = route
+                await self.send_screen(update, text, reply_markup)
             else:
                 # Unknown action
                 await query.edit_message_text(
                     f"🚧 **Action Not Available**\n\nThe feature '{callback_data}' is not implemented yet.\n\nUse the menu to navigate to available features.",
                     parse_mode='Markdown',
-                    reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("🏠 Menu", callback_data="main_menu")]])
+                    reply_markup=BACK_TO_MENU_MARKUP
                 )
                 
         except Exception as e:
-            logger.error(f"Button handler error: {e}")
+            logger.error("Button handler error: %s", e)
             self.metrics.log_error(str(e))
             await query.edit_message_text(
                 "❌ An error occurred. Please try again.",
-                reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("🏠 Menu", callback_data="main_menu")]])
+                reply_markup=BACK_TO_MENU_MARKUP
             )
+        finally:
+            try:
+                await answer_task
+            except Exception as e:
+                logger.warning("Callback answer failed: %s", e)
     
     async def handle_photo_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle photo messages (receipts)"""
@@ -1320,25 +1701,57 @@ Choose an action:
     async def handle_error(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle errors"""
         error = context.error
-        logger.error(f"Update {update} caused error: {error}")
         self.metrics.log_error(str(error))
         
-        if update and update.effective_message:
-            try:
-                await update.effective_message.reply_text(
-                    "❌ An error occurred. Please try again or use /start to restart."
-                )
-            except:
-                pass
+        # Telegram itself is unreachable or throttling us; a reply would fail the same way.
+        # BadRequest subclasses NetworkError but means our request was wrong, so still notify
+        if isinstance(error, (RetryAfter, TimedOut)) or (
+            isinstance(error, NetworkError) and not isinstance(error, BadRequest)
+        ):
+            return
+        
+        if not isinstance(update, Update) or not update.effective_message:
+            return
+        
+        # Coalesce bursts of failures in one chat into a single notice
+        chat_id = update.effective_message.chat_id
+        now = time.monotonic()
+        if now - self._error_notices.get(chat_id, float("-inf")) < ERROR_NOTICE_INTERVAL:
+            return
+        self._error_notices[chat_id] = now
+        self._error_notices.move_to_end(chat_id)
+        if len(self._error_notices) > MAX_TRACKED_USERS:
+            self._error_notices.popitem(last=False)
+        
+        try:
+            await update.effective_message.reply_text(
+                "❌ An error occurred. Please try again or use /start to restart."
+            )
+        except Exception as e:
+            logger.warning("Could not send error notice: %s", e)
+
+def start_background_logging() -> QueueListener:
+    """Route log records through a queue so handlers write from a background thread"""
+    root = logging.getLogger()
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+    root.handlers = [QueueHandler(log_queue)]
+    listener.start()
+    return listener
 
 # Simplified main function without asyncio conflicts
 def main():
     """Main function - uses run_polling to avoid event loop conflicts"""
+    log_listener = start_background_logging()
     try:
         logger.info("🚀 Starting UmbraSIL Bot...")
         
+        # Must be set before run_polling creates the event loop
+        if UVLOOP_AVAILABLE:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        
         # Create bot instance
-        bot = UmbraSILBot()
+        bot = UmbraSILBot(load_config())
         
         # Run with polling (Railway handles health checks via PORT)
         logger.info("✅ Bot initialized, starting polling...")
@@ -1349,8 +1762,10 @@ def main():
     except KeyboardInterrupt:
         logger.info("Bot stopped by user")
     except Exception as e:
-        logger.critical(f"Fatal error: {e}")
+        logger.critical("Fatal error: %s", e)
         sys.exit(1)
+    finally:
+        log_listener.stop()
 
 if __name__ == "__main__":
     main()
@@ -11,6 +11,19 @@ from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 import aiohttp
 
+# Optional faster JSON codec with stdlib fallback
+try:
+    import orjson
+
+    def json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    json_loads = orjson.loads
+except ImportError:
+    json_dumps = json.dumps
+    json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 class NLPManager:
@@ -19,6 +32,14 @@ class NLPManager:
     def __init__(self):
         self.api_key = os.getenv("OPENROUTER_API_KEY", "")
         self.base_url = "https://openrouter.ai/api/v1/chat/completions"
+        self.headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+            "HTTP-Referer": "https://github.com/silvioiatech/UmbraSIL",
+            "X-Title": "UmbraSIL Bot"
+        }
+        # Shared keep-alive session, created on first use inside the event loop
+        self._session: Optional[aiohttp.ClientSession] = None
         
         # Model selection from environment or defaults
         self.models = {
@@ -82,6 +103,17 @@ class NLPManager:
         """Check if NLP is configured and operational"""
         return bool(self.api_key)
     
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared OpenRouter session, reusing its pooled connections"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(headers=self.headers, json_serialize=json_dumps)
+        return self._session
+    
+    async def close(self):
+        """Close the shared HTTP session"""
+        if self._session and not self._session.closed:
+            await self._session.close()
+    
     async def process_message(self, message: str, user_context: Dict = None) -> Dict[str, Any]:
         """
         Process a natural language message and extract intent and entities
@@ -180,57 +212,51 @@ class NLPManager:
         
         try:
             # Call OpenRouter API
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json",
-                    "HTTP-Referer": "https://github.com/silvioiatech/UmbraSIL",
-                    "X-Title": "UmbraSIL Bot"
-                }
-                
-                payload = {
-                    "model": model,
-                    "messages": [
-                        {
-                            "role": "system",
-                            "content": "You are a financial assistant that extracts transaction details from messages. Always respond with valid JSON only."
-                        },
-                        {
-                            "role": "user",
-                            "content": prompt
-                        }
-                    ],
-                    "temperature": 0.3,
-                    "max_tokens": 200
-                }
-                
-                async with session.post(self.base_url, headers=headers, json=payload) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        ai_response = data['choices'][0]['message']['content']
+            session = self._get_session()
+            
+            payload = {
+                "model": model,
+                "messages": [
+                    {
+                        "role": "system",
+                        "content": "You are a financial assistant that extracts transaction details from messages. Always respond with valid JSON only."
+                    },
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ],
+                "temperature": 0.3,
+                "max_tokens": 200
+            }
+            
+            async with session.post(self.base_url, json=payload) as response:
+                if response.status == 200:
+                    data = await response.json(loads=json_loads)
+                    ai_response = data['choices'][0]['message']['content']
+                    
+                    # Parse AI response
+                    try:
+                        # Clean up response if it has markdown
+                        ai_response = ai_response.replace('```json', '').replace('```', '').strip()
+                        result = json_loads(ai_response)
                         
-                        # Parse AI response
-                        try:
-                            # Clean up response if it has markdown
-                            ai_response = ai_response.replace('```json', '').replace('```', '').strip()
-                            result = json.loads(ai_response)
-                            
-                            # Enhance with category detection
-                            if result.get('intent') == 'expense' and result.get('entities', {}).get('vendor'):
-                                vendor = result['entities']['vendor']
-                                if not result['entities'].get('category'):
-                                    result['entities']['category'] = self._get_category(vendor)
-                            
-                            return result
-                        except json.JSONDecodeError:
-                            logger.error(f"Failed to parse AI response: {ai_response}")
-                            return self._fallback_parse(message)
-                    else:
-                        logger.error(f"OpenRouter API error: {response.status}")
-                        return self._fallback_parse(message)
+                        # Enhance with category detection
+                        if result.get('intent') == 'expense' and result.get('entities', {}).get('vendor'):
+                            vendor = result['entities']['vendor']
+                            if not result['entities'].get('category'):
+                                result['entities']['category'] = self._get_category(vendor)
                         
+                        return result
+                    except json.JSONDecodeError:
+                        logger.error("Failed to parse AI response: %s", ai_response)
+                        return self._fallback_parse(message)
+                else:
+                    logger.error("OpenRouter API error: %s", response.status)
+                    return self._fallback_parse(message)
+                    
         except Exception as e:
-            logger.error(f"AI parsing error: {e}")
+            logger.error("AI parsing error: %s", e)
             return self._fallback_parse(message)
     
     def _select_model(self, message: str) -> str:
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Tests for the persistent VPS SSH session
+"""
+
+import sys
+import threading
+import types
+from pathlib import Path
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import main
+
+
+class FakeSSHClient:
+    """Stand-in for paramiko.SSHClient that records its lifecycle"""
+    instances = []
+    fail_connect = False
+    command_started = None
+    release_command = None
+
+    def __init__(self):
+        self.closed = False
+        self.instances.append(self)
+
+    def set_missing_host_key_policy(self, policy):
+        pass
+
+    def connect(self, **kwargs):
+        if self.fail_connect:
+            raise OSError("connection refused")
+
+    def get_transport(self):
+        return types.SimpleNamespace(is_active=lambda: not self.closed, set_keepalive=lambda interval: None)
+
+    def exec_command(self, command, timeout=None):
+        self.command_started.set()
+        self.release_command.wait(timeout=1)
+        assert not self.closed
+        return None, types.SimpleNamespace(read=lambda: b"up 1 day"), None
+
+    def close(self):
+        self.closed = True
+
+
+def make_manager(monkeypatch):
+    FakeSSHClient.instances = []
+    FakeSSHClient.command_started = threading.Event()
+    FakeSSHClient.release_command = threading.Event()
+    fake_paramiko = types.SimpleNamespace(SSHClient=FakeSSHClient, AutoAddPolicy=lambda: None)
+    monkeypatch.setattr(main, "paramiko", fake_paramiko, raising=False)
+    monkeypatch.setattr(main, "PARAMIKO_AVAILABLE", True)
+    manager = main.BusinessManager()
+    manager.vps_config["host"] = "vps.example"
+    return manager
+
+
+def test_failed_connect_closes_the_new_client(monkeypatch):
+    manager = make_manager(monkeypatch)
+    monkeypatch.setattr(FakeSSHClient, "fail_connect", True)
+    assert manager._probe_vps() == {"error": "connection refused"}
+    assert [client.closed for client in FakeSSHClient.instances] == [True]
+    assert manager._ssh is None
+
+
+def test_close_waits_for_a_probe_in_flight(monkeypatch):
+    manager = make_manager(monkeypatch)
+    results = []
+    probe = threading.Thread(target=lambda: results.append(manager._probe_vps()))
+    probe.start()
+    FakeSSHClient.command_started.wait(timeout=1)
+
+    closer = threading.Thread(target=manager.close)
+    closer.start()
+    closer.join(timeout=0.05)
+    assert closer.is_alive()
+
+    FakeSSHClient.release_command.set()
+    probe.join(timeout=1)
+    closer.join(timeout=1)
+    assert results == [{"status": "connected", "info": "up 1 day"}]
+    assert FakeSSHClient.instances[0].closed
@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared bot/core managers
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from bot.core import DatabaseManager
+
+
+def test_check_connection_returns_the_flag_without_awaiting():
+    db = DatabaseManager()
+    asyncio.run(db.initialize())
+    assert db.check_connection() is True
+    db.connected = False
+    assert db.check_connection() is False
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Tests for system metrics sampling
+"""
+
+import asyncio
+import sys
+import threading
+from pathlib import Path
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import main
+
+
+def test_cpu_is_sampled_on_the_thread_that_primed_it(monkeypatch):
+    # psutil keeps the cpu_percent(interval=None) baseline per thread
+    callers = []
+
+    def fake_cpu_percent(interval=None):
+        callers.append(threading.get_ident())
+        return 42.0
+
+    monkeypatch.setattr(main.psutil, "cpu_percent", fake_cpu_percent)
+    monitoring = main.MonitoringManager()
+    metrics = asyncio.run(monitoring.get_system_metrics())
+
+    assert metrics["cpu_percent"] == 42.0
+    assert set(metrics) == {"cpu_percent", "memory_percent", "disk_percent"}
+    assert callers == [threading.get_ident()] * 2
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Tests for the outbound Bot API rate limiter
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+from telegram.error import BadRequest, Forbidden, NetworkError, RetryAfter, TimedOut
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import main
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record asyncio.sleep delays instead of waiting"""
+    recorded = []
+
+    async def fake_sleep(delay):
+        recorded.append(delay)
+
+    monkeypatch.setattr(main.asyncio, "sleep", fake_sleep)
+    return recorded
+
+
+def make_callback(*outcomes):
+    """Callback that raises each exception in turn, then returns True"""
+    calls = []
+
+    async def callback(*args, **kwargs):
+        calls.append(args)
+        if len(calls) <= len(outcomes):
+            raise outcomes[len(calls) - 1]
+        return True
+
+    return callback, calls
+
+
+def process(limiter, callback):
+    return asyncio.run(limiter.process_request(callback, (), {}, "sendMessage", {}, None))
+
+
+def test_retry_after_waits_for_server_delay(sleeps):
+    callback, calls = make_callback(RetryAfter(3))
+    assert process(main.RetryingRateLimiter(max_retries=3), callback) is True
+    assert len(calls) == 2
+    assert 3 <= sleeps[0] <= 3.25
+
+
+def test_network_error_backs_off_then_gives_up(sleeps):
+    callback, calls = make_callback(*[NetworkError("connection reset")] * 4)
+    with pytest.raises(NetworkError):
+        process(main.RetryingRateLimiter(max_retries=3), callback)
+    assert len(calls) == 4
+    assert [int(delay) for delay in sleeps] == [1, 2, 4]
+
+
+@pytest.mark.parametrize("error", [
+    BadRequest("Message is not modified"),
+    Forbidden("bot was blocked by the user"),
+    TimedOut()
+])
+def test_non_transient_errors_are_not_retried(sleeps, error):
+    callback, calls = make_callback(error)
+    with pytest.raises(type(error)):
+        process(main.RetryingRateLimiter(max_retries=3), callback)
+    assert len(calls) == 1
+    assert sleeps == []
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable stand-in for time.monotonic"""
+    now = [1000.0]
+    monkeypatch.setattr(main.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_token_bucket_allows_burst_then_spaces_requests(clock):
+    bucket = main.TokenBucket(rate=1.0, capacity=3)
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert [bucket.reserve() for _ in range(2)] == [1.0, 2.0]
+
+
+def test_token_bucket_refills_up_to_capacity(clock):
+    bucket = main.TokenBucket(rate=1.0, capacity=3)
+    for _ in range(3):
+        bucket.reserve()
+    clock[0] += 1.5
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.5)
+    clock[0] += 100
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+
+
+def test_reserve_applies_chat_and_global_limits(clock):
+    limiter = main.RetryingRateLimiter()
+    burst = main.CHAT_SEND_BURST
+    assert [limiter._reserve(1) for _ in range(burst)] == [0.0] * burst
+    # The chat's burst is spent, but other chats and chatless calls are unaffected
+    assert limiter._reserve(1) == pytest.approx(1 / main.CHAT_SEND_RATE)
+    assert limiter._reserve(2) == 0.0
+    assert limiter._reserve(None) == 0.0
+    # Exhaust the global bucket; everyone now waits on it
+    while limiter._reserve(None) == 0.0:
+        pass
+    assert limiter._reserve(3) > 0.0
+
+
+def test_reserve_evicts_least_recently_used_chat(clock, monkeypatch):
+    monkeypatch.setattr(main, "MAX_TRACKED_USERS", 2)
+    limiter = main.RetryingRateLimiter()
+    limiter._reserve(1)
+    limiter._reserve(2)
+    limiter._reserve(1)
+    limiter._reserve(3)
+    assert list(limiter._chat_buckets) == [1, 3]
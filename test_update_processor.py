@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Tests for per-chat ordered concurrent update processing
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from telegram import Update
+
+# Add the project root to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import main
+
+
+def make_update(chat_id):
+    update = MagicMock(spec=Update)
+    update.effective_chat.id = chat_id
+    return update
+
+
+def test_updates_in_one_chat_run_in_arrival_order():
+    async def run():
+        processor = main.ChatOrderedUpdateProcessor(8)
+        finished = []
+
+        async def work(tag, delay):
+            await asyncio.sleep(delay)
+            finished.append(tag)
+
+        await asyncio.gather(
+            processor.process_update(make_update(1), work("first", 0.05)),
+            processor.process_update(make_update(1), work("second", 0))
+        )
+        return finished, processor
+
+    finished, processor = asyncio.run(run())
+    assert finished == ["first", "second"]
+    assert processor._chat_locks == {}
+    assert processor._chat_pending == {}
+
+
+def test_backlog_in_one_chat_does_not_block_other_chats():
+    async def run():
+        processor = main.ChatOrderedUpdateProcessor(2)
+        release = asyncio.Event()
+        finished = []
+
+        async def slow():
+            await release.wait()
+            finished.append("slow")
+
+        async def fast(tag):
+            finished.append(tag)
+
+        # One stuck update plus a backlog in chat 1, more than there are slots
+        busy = [asyncio.create_task(processor.process_update(make_update(1), slow()))]
+        busy += [
+            asyncio.create_task(processor.process_update(make_update(1), fast(f"queued-{i}")))
+            for i in range(4)
+        ]
+        await asyncio.sleep(0)
+        await asyncio.wait_for(processor.process_update(make_update(2), fast("other chat")), timeout=1)
+        await asyncio.wait_for(processor.process_update(object(), fast("no chat")), timeout=1)
+        release.set()
+        await asyncio.gather(*busy)
+        return finished
+
+    finished = asyncio.run(run())
+    assert finished[:3] == ["other chat", "no chat", "slow"]
+    assert finished[3:] == [f"queued-{i}" for i in range(4)]
+
+
+def test_concurrency_limit_applies_across_chats():
+    async def run():
+        processor = main.ChatOrderedUpdateProcessor(2)
+        running = []
+        peak = []
+
+        async def work():
+            running.append(1)
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.pop()
+
+        await asyncio.gather(*(
+            processor.process_update(make_update(chat_id), work()) for chat_id in range(6)
+        ))
+        return max(peak)
+
+    assert asyncio.run(run()) == 2